@@ -20,20 +20,1089 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import array
 import os
+import queue
+import socket
+import subprocess
+import threading
+import time
+
+from collections import deque
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
 
 # python 3.4+
 from pathlib import Path
 
 from RizomUVLinkBase import CRizomUVLinkBase
 from RizomUVLinkBase import CZEx
+from RizomUVLinkMesh import CompactPrecisionReport
+from RizomUVLinkMesh import CSharedMesh
+from RizomUVLinkMesh import CUVWState
+from RizomUVLinkMesh import FlatView
+from RizomUVLinkMesh import MeshKey
+from RizomUVLinkMesh import ConvertSaveOutput
+from RizomUVLinkMesh import PrepareLoadParameters
 
-class CRizomUVLink(CRizomUVLinkBase):
+class CPortAllocator:
+    """ Process wide registry of the TCP ports given to the RizomUV instances ran from this process
+
+        A free port is obtained in one step by letting the OS assign one (bind on port 0).
+        The port stays reserved in the registry until it is released, so two launches
+        running at the same time never get the same port even before the RizomUV
+        instances had the time to bind it.
+    """
     def __init__(self):
+        self.lock = threading.Lock()
+        self.reserved = set()
+
+    def Reserve(self) -> int:
+        """ Returns a free TCP port and reserves it """
+        with self.lock:
+            for attempt in range(64):
+                port = self.OSAssignedPort()
+                if port not in self.reserved:
+                    self.reserved.add(port)
+                    return port
+        raise CZEx("No available TCP Port found. This shouldn't be the case. Might worth to check your firewall settings just in case.")
+
+    def ReservePort(self, port : int):
+        """ Reserves a port chosen by the caller """
+        with self.lock:
+            if port in self.reserved:
+                raise CZEx("Port " + str(port) + " is already used by another RizomUV instance of this process, please connect using another port")
+            self.reserved.add(port)
+
+    def Release(self, port : int):
+        with self.lock:
+            self.reserved.discard(port)
+
+    @staticmethod
+    def OSAssignedPort() -> int:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", 0))
+            return s.getsockname()[1]
+
+portAllocator = CPortAllocator()
+
+class CReadinessPolicy:
+    """ How RunRizomUV() waits for a RizomUV instance to be ready. Durations are in milliseconds
+
+        deadlineMs:     overall time allowed to the instance to answer its first request
+        pollMs:         first delay between two checks of the instance TCP port
+        maxPollMs:      the delay is multiplied by backoff after each check up to that value
+        backoff:        delay multiplier
+        replyProbeMs:   timeout of each request sent while waiting for the first reply,
+                        the child process is checked between two requests
+    """
+    def __init__(self, deadlineMs : int = 60000, pollMs : int = 20, maxPollMs : int = 500, backoff : float = 1.5, replyProbeMs : int = 2000):
+        self.deadlineMs = deadlineMs
+        self.pollMs = pollMs
+        self.maxPollMs = maxPollMs
+        self.backoff = backoff
+        self.replyProbeMs = replyProbeMs
+
+def DataParameter(parameters, name : str):
+    """ Returns the Data.<name> parameter given either as a "Data.<name>" key
+        or as a member of a "Data" table, None if not present """
+    if not isinstance(parameters, dict):
+        return None
+    value = parameters.get("Data." + name)
+    if value is None and isinstance(parameters.get("Data"), dict):
+        value = parameters["Data"].get(name)
+    return value
+
+class CTimeoutPolicy:
+    """ Execute() timeouts in milliseconds
+
+        The timeout of a command is: commandMs[command] (or defaultMs) + perItemMs[command] * size
+        where size is the polygon count of the Data.* payload of a Load, or else
+        the polygon count of the last mesh loaded from data (see meshSize). A Load
+        replacing the mesh without its Data.* arrays (from a file, DefaultEmptyScene
+        or DataMesh) resets meshSize to 0 (unknown). UV only Loads keep it and are
+        sized by their Data.CoordsUVW vertex count.
+
+        Every Execute() duration is recorded by Observe(). AutoTune() then sets the
+        defaults from the observed durations, i.e. for the meshes of the current pipeline.
+    """
+    def __init__(self, defaultMs : int = 2000):
+        self.defaultMs = defaultMs
+        self.commandMs = {
+            "Load": 10000,
+            "Save": 10000,
+            "Unfold": 10000,
+            "Optimize": 10000,
+            "Pack": 10000,
+            "Cut": 5000,
+            "Weld": 5000,
+            "Select": 5000,
+            "Deform": 5000,
+            "IslandGroups": 5000,
+            "Hotspot": 10000,
+            "RasterExport": 10000,
+        }
+        self.perItemMs = {
+            "Load": 0.02,
+            "Save": 0.01,
+            "Unfold": 0.2,
+            "Optimize": 0.2,
+            "Pack": 0.1,
+            "Cut": 0.01,
+            "Weld": 0.01,
+            "Select": 0.01,
+            "Hotspot": 0.1,
+        }
+        self.meshSize = 0
+        self.observed = {}
+        self.historySize = 256
+
+    def PayloadSize(self, commandName : str, parameters) -> int:
+        if commandName == "Load":
+            polySizes = DataParameter(parameters, "PolySizes")
+            if polySizes is not None:
+                return len(polySizes)
+            coords = DataParameter(parameters, "CoordsXYZ")
+            if coords is not None:
+                return len(coords) // 3
+            if self.ReplacesMesh(parameters):
+                return 0
+            uvws = DataParameter(parameters, "CoordsUVW")
+            if uvws is not None:
+                return len(uvws) // 3
+        return self.meshSize
+
+    @staticmethod
+    def ReplacesMesh(parameters) -> bool:
+        """ Returns True for the Loads replacing the mesh without giving its Data.* arrays """
+        if not isinstance(parameters, dict):
+            return False
+        fileTable = parameters.get("File")
+        return ("File.Path" in parameters or (isinstance(fileTable, dict) and "Path" in fileTable)
+                or "DefaultEmptyScene" in parameters or "DataMesh" in parameters)
+
+    def TimeoutMs(self, commandName : str, size : int = 0) -> int:
+        timeout = self.commandMs.get(commandName, self.defaultMs) + self.perItemMs.get(commandName, 0.0) * size
+        return int(timeout)
+
+    def Observe(self, commandName : str, parameters, size : int, seconds : float):
+        if commandName == "Load":
+            if DataParameter(parameters, "PolySizes") is not None or DataParameter(parameters, "CoordsXYZ") is not None:
+                self.meshSize = size
+            elif self.ReplacesMesh(parameters):
+                self.meshSize = 0
+        history = self.observed.get(commandName)
+        if history is None:
+            history = self.observed[commandName] = deque(maxlen = self.historySize)
+        history.append((size, seconds))
+
+    def AutoTune(self, margin : float = 3.0, minSamples : int = 5, minMs : int = 500):
+        """ Sets the defaults of each command observed at least minSamples times to margin
+            times the 95th percentile of its observed durations (per polygon for the
+            commands scaled by the mesh size)
+
+            For the commands scaled by the mesh size, only perItemMs is tuned from the
+            sized samples. Their base commandMs, used alone when the size is unknown,
+            is only raised by the samples of unknown size, never lowered. """
+        def percentile95(values):
+            values = sorted(values)
+            return values[min(len(values) - 1, int(len(values) * 0.95))]
+
+        for commandName, history in self.observed.items():
+            if len(history) < minSamples:
+                continue
+            sized = [(size, seconds) for size, seconds in history if size > 0]
+            if commandName in self.perItemMs and sized:
+                self.perItemMs[commandName] = margin * percentile95([seconds * 1000.0 / size for size, seconds in sized])
+                unsized = [seconds * 1000.0 for size, seconds in history if size <= 0]
+                if unsized:
+                    base = self.commandMs.get(commandName, self.defaultMs)
+                    self.commandMs[commandName] = max(base, int(margin * percentile95(unsized)))
+            else:
+                self.commandMs[commandName] = max(minMs, int(margin * percentile95([seconds * 1000.0 for size, seconds in history])))
+
+# commands that do not modify the mesh, its UVs or its selections
+READ_ONLY_COMMANDS = frozenset([
+    "Get", "GetAsString", "Count", "ItemNames", "Eval", "GetVersion", "Subscribe",
+    "Save", "SavePreferences", "PsExport", "RasterExport", "GenerateScriptingHelp",
+    "GenPythonModule", "SnapshotWindowTree",
+])
+
+# data tree path whose recursive version covers the whole loaded mesh
+MESH_VERSION_PATH = {"Path": "Lib.Mesh", "Recursive": True}
+
+def PathsOverlap(path : str, other : str) -> bool:
+    """ Returns True if one data tree path is the other one or one of its ancestors """
+    return path == other or path.startswith(other + ".") or other.startswith(path + ".")
+
+class CReadCache:
+    """ Size bounded LRU cache of Get, GetAsString, Count, ItemNames and Eval results by path
+
+        validation selects how a cached result is known to be still valid:
+
+          - "version": each read first requests the GetVersion token of the path
+            (recursive) and the result is reused when the token did not move. As
+            computed values may depend on any part of the mesh, Eval results are
+            validated by the recursive token of the whole mesh (MESH_VERSION_PATH).
+            This still costs a request, but a light one: no value is transferred
+            nor serialised.
+
+          - "notify": results are reused without any request until a change
+            notification of an overlapping path is received by the link listener
+            (see StartNotificationListener) or until a command that may modify
+            the data is sent through the link. Eval results are dropped on every
+            notification, as computed values may depend on any path. Only paths
+            covered by the subscription are safe to read this way.
+
+        Cached values are shared: do not modify the returned lists or dicts.
+    """
+    def __init__(self, maxEntries : int = 1024, validation : str = "version"):
+        if validation not in ("version", "notify"):
+            raise CZEx("Unknown read cache validation: " + str(validation) + ", use \"version\" or \"notify\"")
+        self.maxEntries = maxEntries
+        self.validation = validation
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def Lookup(self, key : tuple, token = None):
+        """ Returns (True, value) if key is cached with the same token, (False, None) otherwise """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] == token:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[0]
+            self.misses += 1
+            return False, None
+
+    def Store(self, key : tuple, value, token = None):
+        with self.lock:
+            self.entries[key] = (value, token)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxEntries:
+                self.entries.popitem(last = False)
+                self.evictions += 1
+
+    def Invalidate(self, path : str = None):
+        """ Drops the results of the paths overlapping path, or all of them if path is None """
+        with self.lock:
+            if path is None:
+                dropped = list(self.entries)
+            else:
+                dropped = [key for key in self.entries if key[0] == "Eval" or PathsOverlap(key[1], path)]
+            for key in dropped:
+                del self.entries[key]
+            self.invalidations += len(dropped)
+
+    def Stats(self) -> dict:
+        with self.lock:
+            reads = self.hits + self.misses
+            return {
+                "Entries": len(self.entries),
+                "Hits": self.hits,
+                "Misses": self.misses,
+                "HitRate": self.hits / reads if reads else 0.0,
+                "Evictions": self.evictions,
+                "Invalidations": self.invalidations,
+            }
+
+class CCoalescer:
+    """ Collapses change notifications into batches
+
+        Add(path, version) records the latest version of each path. The pending
+        changes are delivered as one callback({path: version}) call, from a
+        background thread, once no notification arrived for quiet_ms, or at
+        the latest max_latency_ms after the first pending one. A long operation
+        firing many intermediate versions then triggers a single callback.
+    """
+    def __init__(self, callback, quiet_ms = 100, max_latency_ms = 1000):
+        self.callback = callback
+        self.quiet_ms = quiet_ms
+        self.max_latency_ms = max_latency_ms
+        self.pending = OrderedDict()
+        self.first = None
+        self.last = None
+        self.stopped = False
+        self.received = 0
+        self.delivered = 0
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target = self._Loop, daemon = True)
+        self.thread.start()
+
+    def Add(self, path, version):
+        with self.condition:
+            now = time.perf_counter()
+            if not self.pending:
+                self.first = now
+            self.pending[path] = version
+            self.pending.move_to_end(path)
+            self.last = now
+            self.received += 1
+            self.condition.notify()
+
+    def Stop(self, flush : bool = True):
+        """ Stops the delivery thread, delivering the pending changes first if flush """
+        with self.condition:
+            self.stopped = True
+            if not flush:
+                self.pending.clear()
+            self.condition.notify()
+        self.thread.join(timeout = 2.0)
+
+    def _Loop(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.stopped:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                deadline = min(self.last + self.quiet_ms / 1000.0, self.first + self.max_latency_ms / 1000.0)
+                remaining = deadline - time.perf_counter()
+                if remaining > 0 and not self.stopped:
+                    self.condition.wait(remaining)
+                    continue
+                changed = dict(self.pending)
+                self.pending.clear()
+                self.delivered += 1
+            try:
+                self.callback(changed)
+            except Exception:
+                pass
+
+class CBatch:
+    """ A list of commands executed in a row by Run()
+
+        Commands are added with Add(commandName, parameters) or by calling the
+        command methods on the batch itself:
+
+            batch = link.Batch()
+            batch.Select({"PrimType": "Island", "All": True, "Select": True})
+            batch.Unfold({})
+            batch.Pack({"Translate": True})
+            results = batch.Run()
+
+        or in a with block, the batch being ran at the end of the block and the
+        results stored in its results attribute.
+    """
+    def __init__(self, link):
+        self.link = link
+        self.commands = []
+        self.results = None
+
+    def __getattr__(self, name):
+        if name.startswith("_") or not callable(getattr(self.link, name, None)):
+            raise AttributeError(name)
+        return lambda params = {}: self.Add(name, params)
+
+    def __len__(self):
+        return len(self.commands)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        if excType is None:
+            self.Run()
+
+    def Add(self, commandName : str, parameters = {}):
+        self.commands.append((commandName, parameters))
+        return self
+
+    def Run(self, stopOnError : bool = False) -> list:
+        """ Executes the commands and returns one (result, error) pair per command,
+            error being None on success and the raised CZEx otherwise. With stopOnError
+            the commands following a failed one are not sent and get no pair. """
+        self.results = self.link.ExecuteBatch(self.commands, stopOnError)
+        self.commands = []
+        return self.results
+
+class CFairLock:
+    """ Re-entrant lock granted in request order (first come, first served)
+
+        Records how long the threads waited for it, see Stats().
+    """
+    def __init__(self):
+        self.condition = threading.Condition(threading.Lock())
+        self.nextTicket = 0
+        self.serving = 0
+        self.owner = None
+        self.depth = 0
+        self.acquisitions = 0
+        self.contentions = 0
+        self.waitSeconds = 0.0
+        self.maxWaitSeconds = 0.0
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        self.release()
+
+    def acquire(self):
+        me = threading.get_ident()
+        with self.condition:
+            if self.owner == me:
+                self.depth += 1
+                return True
+            ticket = self.nextTicket
+            self.nextTicket += 1
+            start = time.perf_counter()
+            if ticket != self.serving:
+                self.contentions += 1
+                while ticket != self.serving:
+                    self.condition.wait()
+            wait = time.perf_counter() - start
+            self.owner = me
+            self.depth = 1
+            self.acquisitions += 1
+            self.waitSeconds += wait
+            self.maxWaitSeconds = max(self.maxWaitSeconds, wait)
+            return True
+
+    def release(self):
+        with self.condition:
+            if self.owner != threading.get_ident():
+                raise RuntimeError("CFairLock released by a thread that does not own it")
+            self.depth -= 1
+            if self.depth == 0:
+                self.owner = None
+                self.serving += 1
+                self.condition.notify_all()
+
+    def Stats(self) -> dict:
+        """ Returns the acquisition count, how many of them had to wait, the total,
+            mean and max waiting time in seconds and the number of waiting threads """
+        with self.condition:
+            return {
+                "Acquisitions": self.acquisitions,
+                "Contentions": self.contentions,
+                "WaitSeconds": self.waitSeconds,
+                "MeanWaitSeconds": self.waitSeconds / self.acquisitions if self.acquisitions else 0.0,
+                "MaxWaitSeconds": self.maxWaitSeconds,
+                "Waiting": self.nextTicket - self.serving - (1 if self.owner is not None else 0),
+            }
+
+class CRizomUVLink(CRizomUVLinkBase):
+    """ Link to a RizomUV standalone instance
+
+        A link can be used from several threads. By default the commands share
+        one command channel and are serialised by a fair lock (see the lock
+        attribute, its Stats() gives the time spent waiting for the channel).
+        With perThreadChannels, each thread other than the one that created the
+        link opens its own command channel to the same instance, so the
+        commands of different threads do not wait for each other on the client side.
+    """
+    def __init__(self, perThreadChannels : bool = False):
         super().__init__()
         self.port = None
+        self.reservedPort = None
+        self.url = None
+        self.perThreadChannels = perThreadChannels
+        self.ownerThread = threading.get_ident()
+        self.lock = CFairLock()
+        self.process = None
+        self.launchSeconds = None
+        self.readiness = CReadinessPolicy()
+        self.startupTimings = {}
+        self.timeouts = CTimeoutPolicy()
+        self.local = threading.local()
+        self.submitted = queue.Queue()
+        self.dispatcher = None
+        self.dispatcherLock = threading.Lock()
+        self.uvw = None
+        self.uvwTracking = False
+        self.meshResidency = False
+        self.residentMesh = None
+        self.residencyHits = 0
+        self.residencyMisses = 0
+        self.readCache = None
+
+    def Execute(self, commandName, parameters, timeoutMs : int = None):
+        """ Sends a command to RizomUV and returns its result
+
+            The timeout is, by order of priority, timeoutMs, the one set by a
+            Timeout() block, or the one given by the timeouts policy (see CTimeoutPolicy).
+        """
+        size = self.timeouts.PayloadSize(commandName, parameters)
+        if timeoutMs is None:
+            timeoutMs = getattr(self.local, "timeoutMs", None)
+        if timeoutMs is None:
+            timeoutMs = self.timeouts.TimeoutMs(commandName, size)
+
+        start = time.perf_counter()
+        with self.CommandLock():
+            result = self.Channel().Execute(commandName, parameters, int(timeoutMs))
+        self.timeouts.Observe(commandName, parameters, size, time.perf_counter() - start)
+        if commandName not in READ_ONLY_COMMANDS:
+            self.residentMesh = None
+            if self.readCache is not None and self.readCache.validation == "notify":
+                self.readCache.Invalidate()
+        return result
+
+    def GetVersions(self, paths, recursive : bool = False) -> dict:
+        """ Returns {path: version token} for several data tree paths
+
+            paths items are either dotted path strings, using recursive for all of
+            them, or {"Path": "<dotted.path>", "Recursive": bool} dicts. Duplicated
+            paths are requested once. RizomUV has no bulk version request: these are
+            sequential GetVersion requests, one per path, sent in a row (see Batch).
+            The data can change between two of them, so the tokens are not an atomic
+            snapshot.
+        """
+        requests = OrderedDict()
+        for item in paths:
+            if isinstance(item, dict):
+                path = item["Path"]
+                requests[path] = {"Path": path, "Recursive": bool(item.get("Recursive", recursive))}
+            else:
+                requests[item] = {"Path": item, "Recursive": True} if recursive else item
+
+        batch = self.Batch()
+        for request in requests.values():
+            batch.GetVersion(request)
+        versions = {}
+        for path, (version, error) in zip(requests, batch.Run()):
+            if error is not None:
+                raise error
+            versions[path] = version
+        return versions
+
+    def EnableReadCache(self, maxEntries : int = 1024, validation : str = "version") -> CReadCache:
+        """ Caches the results of Get, GetAsString, Count, ItemNames and Eval called
+            with a path string (see CReadCache). Returns the cache, whose Stats()
+            give the hit / miss counts """
+        self.readCache = CReadCache(maxEntries, validation)
+        return self.readCache
+
+    def DisableReadCache(self):
+        self.readCache = None
+
+    def _CachedRead(self, commandName : str, path):
+        cache = self.readCache
+        if cache is None or not isinstance(path, str):
+            return self.Execute(commandName, path)
+
+        token = None
+        if cache.validation == "version":
+            token = self.GetVersion(MESH_VERSION_PATH if commandName == "Eval" else {"Path": path, "Recursive": True})
+        found, value = cache.Lookup((commandName, path), token)
+        if not found:
+            value = self.Execute(commandName, path)
+            cache.Store((commandName, path), value, token)
+        return value
 
-    def RunRizomUV(self, exePath : str = None, port : int = None, connect : bool = True, wait : bool = True) -> int:
+    def Get(self, params = {}):
+        return self._CachedRead("Get", params)
+
+    def GetAsString(self, params = {}):
+        return self._CachedRead("GetAsString", params)
+
+    def Count(self, params = {}):
+        return self._CachedRead("Count", params)
+
+    def ItemNames(self, params = {}):
+        return self._CachedRead("ItemNames", params)
+
+    def Eval(self, params = {}):
+        return self._CachedRead("Eval", params)
+
+    def StartNotificationListener(self, port, callback, poll_ms = 200, quiet_ms = None, max_latency_ms = 1000):
+        """ Same as CRizomUVLinkBase.StartNotificationListener(), plus:
+
+              - the notifications also invalidate the matching read cache results
+                (see EnableReadCache)
+
+              - with quiet_ms, notifications are coalesced (see CCoalescer): callback
+                receives one {path: version} dict holding the latest version of each
+                changed path, once no notification arrived for quiet_ms, or at the
+                latest max_latency_ms after the first one
+        """
+        deliver = callback
+        coalescer = None
+        if quiet_ms is not None:
+            coalescer = CCoalescer(callback, quiet_ms, max_latency_ms)
+            deliver = coalescer.Add
+
+        def onChange(path, version):
+            if self.readCache is not None:
+                self.readCache.Invalidate(path)
+            deliver(path, version)
+        stop_listener = super().StartNotificationListener(port, onChange, poll_ms)
+        if coalescer is None:
+            return stop_listener
+
+        def stop():
+            stop_listener()
+            coalescer.Stop()
+        return stop
+
+    def StartPoller(self, paths, callback, min_ms = 100, max_ms = 5000, backoff = 2.0, max_requests_per_s = None, quiet_ms = None, max_latency_ms = 1000):
+        """ Polling counterpart of StartNotificationListener(), for when the push channel
+            cannot be used: calls callback(path, version) whenever the GetVersion token
+            of one of the paths changes (paths items as in GetVersions). Returns a stop()
+            function.
+
+            The poll interval starts at min_ms and is multiplied by backoff after each
+            poll that detected nothing, up to max_ms, so an idle instance is barely
+            polled. It falls back to min_ms as soon as a change is detected, to follow
+            an active user closely. max_requests_per_s caps the GetVersion requests
+            sent per second (each poll costs one per path), raising the interval if
+            needed. Changes also invalidate the matching read cache results.
+            quiet_ms and max_latency_ms coalesce the changes into {path: version}
+            callbacks, as for StartNotificationListener().
+        """
+        paths = list(paths)
+        coalescer = None
+        if quiet_ms is not None:
+            coalescer = CCoalescer(callback, quiet_ms, max_latency_ms)
+            callback = coalescer.Add
+        stop_evt = threading.Event()
+        floor_ms = min_ms
+        if max_requests_per_s:
+            floor_ms = max(min_ms, 1000.0 * len(paths) / max_requests_per_s)
+
+        def _loop():
+            versions = {}
+            interval_ms = floor_ms
+            while True:
+                try:
+                    current = self.GetVersions(paths)
+                except CZEx:
+                    current = None
+                    interval_ms = max_ms
+
+                if current is not None:
+                    changed = [path for path, version in current.items() if versions and version != versions.get(path)]
+                    versions = current
+                    for path in changed:
+                        if self.readCache is not None:
+                            self.readCache.Invalidate(path)
+                        try:
+                            callback(path, current[path])
+                        except Exception:
+                            pass
+                    interval_ms = floor_ms if changed else min(interval_ms * backoff, max(max_ms, floor_ms))
+
+                if stop_evt.wait(interval_ms / 1000.0):
+                    break
+
+        thread = threading.Thread(target = _loop, daemon = True)
+        thread.start()
+
+        def stop():
+            stop_evt.set()
+            thread.join(timeout = 2.0)
+            if coalescer is not None:
+                coalescer.Stop()
+        return stop
+
+    def RunCommand(self, commandName : str, parameters = {}):
+        """ Calls the link method named commandName, or Execute() if there is none """
+        method = getattr(self, commandName, None)
+        if callable(method):
+            return method(parameters)
+        return self.Execute(commandName, parameters)
+
+    def Submit(self, commandName : str, parameters = {}) -> Future:
+        """ Queues a command and returns at once a concurrent.futures.Future of its result
+
+            The commands submitted to a link are sent in submission order by a
+            dispatcher thread owned by the link, so the caller can prepare the next
+            job while RizomUV works. A command not sent yet can be cancelled with
+            future.cancel(). Use concurrent.futures.as_completed() or wait() to
+            follow futures of several links.
+        """
+        future = Future()
+        with self.dispatcherLock:
+            if self.dispatcher is None:
+                self.dispatcher = threading.Thread(target = self._Dispatch, name = "RizomUVLink-dispatcher", daemon = True)
+                self.dispatcher.start()
+            self.submitted.put((future, commandName, parameters))
+        return future
+
+    def StopDispatcher(self, wait : bool = True):
+        """ Stops the Submit() dispatcher thread once the already submitted commands are done """
+        with self.dispatcherLock:
+            dispatcher = self.dispatcher
+            if dispatcher is None:
+                return
+            self.submitted.put(None)
+            self.dispatcher = None
+        if wait:
+            dispatcher.join()
+
+    def _Dispatch(self):
+        while True:
+            job = self.submitted.get()
+            if job is None:
+                break
+            future, commandName, parameters = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self.RunCommand(commandName, parameters))
+            except BaseException as ex:
+                future.set_exception(ex)
+
+    def Load(self, params = {}):
+        """ Same as CRizomUVLinkBase.Load(), plus:
+
+              - Data.* ints / doubles arrays can be numpy arrays, array.array or any
+                buffer protocol object instead of lists (see PrepareLoadParameters)
+
+              - when the meshResidency attribute is enabled, loading the mesh the
+                instance already holds is skipped (see ResidentMesh)
+
+              - when the uvwTracking attribute is enabled, the UVWs sent are kept
+                for UploadUVW() and PullUVW() (see the uvw attribute)
+        """
+        params = PrepareLoadParameters(params)
+        key = MeshKey(params) if self.meshResidency else None
+        if key is not None:
+            resident = self.residentMesh
+            if resident is not None and resident[0] == key and self.GetVersion(MESH_VERSION_PATH) == resident[1]:
+                self.residencyHits += 1
+                return resident[2]
+            self.residencyMisses += 1
+
+        result = super().Load(params)
+        self._TrackUVW(params)
+        if key is not None:
+            self.residentMesh = (key, self.GetVersion(MESH_VERSION_PATH), result)
+        return result
+
+    def ResidentMesh(self):
+        """ Returns the key (see MeshKey) of the mesh held by the RizomUV instance, None if unknown
+
+            With the meshResidency attribute enabled, the link remembers the mesh
+            it loaded: a file (path, modification time and size) or Data.* arrays
+            (content hash). Loading the same mesh again is then skipped, as long as
+            no command modifying the mesh was sent since and the "Lib.Mesh" recursive
+            version did not change (i.e. edits made in the RizomUV user interface).
+        """
+        resident = self.residentMesh
+        return resident[0] if resident is not None else None
+
+    def _TrackUVW(self, params):
+        """ Keeps the uvw state (see CUVWState) in sync with the UVWs sent by Load() """
+        if not self.uvwTracking:
+            self.uvw = None
+            return
+        coords = DataParameter(params, "CoordsUVW")
+        polyUVWIDs = DataParameter(params, "PolyUVWIDs")
+        partial = DataParameter(params, "CoordsUVWPartial")
+        if coords is not None and polyUVWIDs is not None:
+            self.uvw = CUVWState(coords, polyUVWIDs)
+        elif coords is not None and self.uvw is not None and len(coords) == len(self.uvw.coords):
+            self.uvw.Update(coords)
+        elif partial is not None and self.uvw is not None:
+            self.uvw.ApplyPartial(partial["PolyVertIDs"], partial["UVWs"])
+        else:
+            self.uvw = None
+        if self.uvw is not None:
+            self.uvw.version = self.GetVersion("Lib.Mesh.UVW")
+
+    def UploadUVW(self, coordsUVW, tolerance : float = 1e-7, maxDeltaRatio : float = 0.25) -> dict:
+        """ Sends new UVW coordinates of the loaded mesh, only the changed ones when possible
+
+            With the uvwTracking attribute enabled, the link keeps the UVWs last sent
+            by Load() (see the uvw attribute). The vertices that moved by more than
+            tolerance are sent as Data.CoordsUVWPartial. The whole Data.CoordsUVW list
+            is sent instead when more than maxDeltaRatio of the vertices changed, or
+            when the UVWs were modified in RizomUV since (Lib.Mesh.UVW version change).
+
+            The mesh must have been loaded with Data.PolyUVWIDs and Data.CoordsUVW,
+            coordsUVW having the same layout (list or buffer protocol object), else
+            CZEx is raised.
+
+            returns:
+                {"Mode": "None" | "Partial" | "Full", "Vertices": sent vertex count}
+        """
+        if self.uvw is None:
+            raise CZEx("UploadUVW needs the uvwTracking attribute enabled and a mesh loaded with Data.PolyUVWIDs and Data.CoordsUVW")
+
+        coords = FlatView(coordsUVW, "d")
+        vertexCount = self.uvw.VertexCount()
+        if len(coords) != 3 * vertexCount:
+            raise CZEx("UploadUVW got " + str(len(coords) // 3) + " UVW vertices, the loaded mesh has " + str(vertexCount))
+        if self.GetVersion("Lib.Mesh.UVW") != self.uvw.version:
+            changed = None
+        else:
+            changed = self.uvw.ChangedVertices(coords, tolerance)
+            if not changed:
+                return {"Mode": "None", "Vertices": 0}
+
+        if changed is None or len(changed) > maxDeltaRatio * vertexCount:
+            self.Load({"Data.CoordsUVW": coords, "Data.UseImportedUVWPolygons": True})
+            return {"Mode": "Full", "Vertices": vertexCount}
+
+        corners = self.uvw.Corners(changed)
+        uvws = []
+        for corner in corners:
+            vertex = self.uvw.polyUVWIDs[corner]
+            uvws.extend(coords[3 * vertex:3 * vertex + 3].tolist())
+        self.Load({"Data.CoordsUVWPartial": {"PolyVertIDs": corners, "UVWs": uvws}})
+        return {"Mode": "Partial", "Vertices": len(changed)}
+
+    def PullUVW(self, tolerance : float = 0.0, useImportedUVWPolygons : bool = False) -> dict:
+        """ Returns the UVW coordinates changed in RizomUV since the last pull (or upload)
+
+            The "Lib.Mesh.UVW" version token is checked first: when it did not move,
+            nothing is transferred. Otherwise the UVWs are exported and compared with
+            the ones the link knows (see the uvw attribute), so that the caller only
+            has to apply the moved vertices. When the link knows no UVWs yet or when
+            the UVW topology changed (i.e. cut / weld), a full sync is returned. The
+            UVWs are known from the previous pull, or from the last Load() when the
+            uvwTracking attribute is enabled.
+
+            useImportedUVWPolygons exports the coordinates using the imported UVW
+            polygons (see Save Data.UseImportedUVWPolygons), for hosts that cannot
+            handle UVW topology changes.
+
+            returns:
+                {"Mode": "None"} when nothing changed,
+                {"Mode": "Partial", "VertexIDs": [...], "CoordsUVW": [u0 v0 w0 u1 v1 w1 ...]}
+                    with the coordinates of the changed vertices only, or
+                {"Mode": "Full", "CoordsUVW": [...], "PolyUVWIDs": [...], "PolySizes": [...]}
+        """
+        version = self.GetVersion("Lib.Mesh.UVW")
+        if self.uvw is not None and version == self.uvw.version:
+            return {"Mode": "None"}
+
+        params = {"Data": True}
+        if useImportedUVWPolygons:
+            params["Data.UseImportedUVWPolygons"] = True
+        data = self.Save(params)["Data"]
+        coords = data["CoordsUVW"]
+        polyUVWIDs = data.get("PolyUVWIDs")
+
+        if self.uvw is not None and len(coords) == len(self.uvw.coords) and (polyUVWIDs is None or array.array("i", polyUVWIDs) == self.uvw.polyUVWIDs):
+            changed = self.uvw.ChangedVertices(coords, tolerance)
+            self.uvw.Update(coords)
+            self.uvw.version = version
+            return {
+                "Mode": "Partial",
+                "VertexIDs": changed,
+                "CoordsUVW": [coords[3 * v + i] for v in changed for i in range(3)],
+            }
+
+        if polyUVWIDs is None:
+            if self.uvw is None:
+                raise CZEx("PullUVW with useImportedUVWPolygons needs a mesh loaded with Data.PolyUVWIDs and Data.CoordsUVW")
+            polyUVWIDs = self.uvw.polyUVWIDs
+        self.uvw = CUVWState(coords, polyUVWIDs)
+        self.uvw.version = version
+        return {
+            "Mode": "Full",
+            "CoordsUVW": coords,
+            "PolyUVWIDs": data.get("PolyUVWIDs", polyUVWIDs),
+            "PolySizes": data.get("PolySizes"),
+        }
+
+    def IterSave(self, chunkSize : int = 65536, indexTables : bool = False, params = {}):
+        """ Generator exporting the UVW data by bounded chunks, for meshes too big for one reply
+
+            The mesh is saved by RizomUV into a temporary OBJ file (params are added to
+            the Save parameters, i.e. {"File.UVWProps": False}) which is then read
+            progressively, so neither a huge Save reply nor the whole mesh is ever
+            held in memory. Yields (member, chunk) pairs, in file order:
+
+                ("CoordsUVW", [u0 v0 w0 ...])    up to chunkSize vertices
+                ("PolySizes", [...])             up to chunkSize polygons
+                ("PolyUVWIDs", [...])            the UVW vertex ids of the same polygons
+
+            Vertex ids are the ones of the exported file. With indexTables, the
+            IndexTable.VertexIDsToIslandIDs and IndexTable.PolygonIDsToIslandIDs lists
+            are then requested (in a single reply, as int32 arrays) and yielded by
+            chunks of chunkSize items as ("VertexIDsToIslandIDs", [...]) and
+            ("PolygonIDsToIslandIDs", [...]).
+
+            Raises CZEx on the first polygon without UVW coordinates, i.e. when the
+            mesh has no UVs.
+        """
+        import tempfile
+        handle, path = tempfile.mkstemp(suffix = ".obj")
+        os.close(handle)
+        try:
+            saveParams = dict(params)
+            saveParams["File.Path"] = path
+            self.Save(saveParams)
+
+            coords = []
+            polySizes = []
+            polyUVWIDs = []
+            uvwCount = 0
+            with open(path, "r") as objFile:
+                for line in objFile:
+                    if line.startswith("vt "):
+                        uvw = [float(value) for value in line.split()[1:4]]
+                        coords.extend(uvw + [0.0] * (3 - len(uvw)))
+                        uvwCount += 1
+                        if len(coords) >= 3 * chunkSize:
+                            yield "CoordsUVW", coords
+                            coords = []
+                    elif line.startswith("f "):
+                        if coords:
+                            yield "CoordsUVW", coords
+                            coords = []
+                        corners = line.split()[1:]
+                        for corner in corners:
+                            # v/vt, v/vt/vn: a corner without vt (v or v//vn) has no UV
+                            indexes = corner.split("/")
+                            if len(indexes) < 2 or not indexes[1]:
+                                raise CZEx("Polygon " + str(len(polySizes)) + " has no UVW coordinates, IterSave needs a mesh with UVs")
+                            uvwID = int(indexes[1])
+                            polyUVWIDs.append(uvwID - 1 if uvwID > 0 else uvwCount + uvwID)
+                        polySizes.append(len(corners))
+                        if len(polySizes) >= chunkSize:
+                            yield "PolySizes", polySizes
+                            yield "PolyUVWIDs", polyUVWIDs
+                            polySizes = []
+                            polyUVWIDs = []
+            if coords:
+                yield "CoordsUVW", coords
+            if polySizes:
+                yield "PolySizes", polySizes
+                yield "PolyUVWIDs", polyUVWIDs
+        finally:
+            os.remove(path)
+
+        if indexTables:
+            output = self.Save({"IndexTable.VertexIDsToIslandIDs": True, "IndexTable.PolygonIDsToIslandIDs": True}, compact = True)
+            for member in ("VertexIDsToIslandIDs", "PolygonIDsToIslandIDs"):
+                table = output["IndexTable"].pop(member)
+                for start in range(0, len(table), chunkSize):
+                    yield member, table[start:start + chunkSize].tolist()
+                del table
+
+    def Save(self, params = {}, asNumpy : bool = False, out : dict = None, coordsType : str = "float64", compact : bool = False):
+        """ Same as CRizomUVLinkBase.Save(), plus:
+
+              - asNumpy: the Data.* and IndexTable.* output lists are returned as numpy
+                arrays, coordinates typed with coordsType ("float64" or "float32") and
+                indexes as int32
+
+              - out: caller buffers to fill instead, by "<table>.<member>" name, i.e.
+                {"Data.CoordsUVW": uvws, "IndexTable.PolygonIDsToIslandIDs": ids}
+                (see ConvertSaveOutput)
+
+              - compact: coordinates are kept as float32 and indexes as int32, as
+                array.array (or numpy arrays with asNumpy), which halves the memory
+                of the output arrays. Use CompactPrecisionReport() to measure the
+                coordinates rounding error
+        """
+        output = super().Save(params)
+
+        if compact:
+            coordsType = "float32"
+        if asNumpy or out or compact:
+            ConvertSaveOutput(output, asNumpy, out, coordsType, compact)
+        return output
+
+    def IterItems(self, path : str, pageSize : int = 256, offset : int = 0, method : str = "Get"):
+        """ Generator walking the children of a big data tree container, i.e. "Lib.Mesh.Islands"
+
+            Yields (name, value) pairs, value being read with method ("Get", "GetAsString",
+            "Count" or "ItemNames") on "<path>.<name>". The child names are listed once,
+            then the values are read pageSize children at a time in a batch, so the
+            client only holds one page of values and each request stays small
+            whatever the container size. offset skips the first children, i.e. to
+            resume an interrupted walk.
+        """
+        names = self.ItemNames(path)
+        for start in range(offset, len(names), pageSize):
+            page = names[start:start + pageSize]
+            batch = self.Batch()
+            for name in page:
+                batch.Add(method, path + "." + str(name))
+            for name, (value, error) in zip(page, batch.Run()):
+                if error is not None:
+                    raise error
+                yield name, value
+
+    def Batch(self) -> CBatch:
+        """ Returns a new empty command batch for that link (see CBatch) """
+        return CBatch(self)
+
+    def ExecuteBatch(self, commands, stopOnError : bool = False) -> list:
+        """ Executes a list of (commandName, parameters) in a row and returns a
+            (result, error) pair for each of them (see CBatch.Run) """
+        results = []
+        with self.CommandLock():
+            for commandName, parameters in commands:
+                try:
+                    result = self.RunCommand(commandName, parameters)
+                except CZEx as ex:
+                    results.append((None, ex))
+                    if stopOnError:
+                        break
+                else:
+                    results.append((result, None))
+        return results
+
+    def Connect(self, port):
+        """ Connects the link to a RizomUV instance
+
+            port is either the instance TCP port number or a complete endpoint string
+            such as "tcp://127.0.0.1:49152", i.e. to reach an instance listening on
+            another kind of endpoint.
+        """
+        if isinstance(port, str) and "://" in port:
+            self.url = port
+        else:
+            self.url = "tcp://127.0.0.1:" + str(port)
+        with self.lock:
+            self.rizomuv.Connect(self.url)
+
+    def Channel(self):
+        """ Returns the command channel of the calling thread """
+        if not self.perThreadChannels or threading.get_ident() == self.ownerThread:
+            return self.rizomuv
+        channel = getattr(self.local, "channel", None)
+        if channel is None or self.local.channelUrl != self.url:
+            from RizomUVLinkBase import rizomuvlink
+            channel = rizomuvlink.RizomUVLinkPyd()
+            if self.url is not None:
+                channel.Connect(self.url)
+            self.local.channel = channel
+            self.local.channelUrl = self.url
+        return channel
+
+    @contextmanager
+    def CommandLock(self):
+        """ Gives the calling thread exclusive use of its command channel in a with block.
+            Only the shared channel is locked, per-thread channels need no lock. """
+        if self.Channel() is self.rizomuv:
+            with self.lock:
+                yield
+        else:
+            yield
+
+    def RizomUVVersion(self):
+        """ Returns the version of the connected RizomUV standalone program"""
+        return self.Execute("Get", "Vars.Infos.Version.Full", 10000)
+
+    @contextmanager
+    def Timeout(self, timeoutMs : int):
+        """ Overrides the timeout of the commands sent from the current thread in a with block:
+
+                with link.Timeout(120000):
+                    link.Unfold({})
+        """
+        previous = getattr(self.local, "timeoutMs", None)
+        self.local.timeoutMs = timeoutMs
+        try:
+            yield
+        finally:
+            self.local.timeoutMs = previous
+
+    def RunRizomUV(self, exePath : str = None, port : int = None, connect : bool = True, wait : bool = True, retries : int = 3) -> int:
         """ Runs RizomUV, connect to the instance and wait for it to be ready
         
             RizomUV standalone version must be 2025.0 or later. 
@@ -41,6 +1110,20 @@ class CRizomUVLink(CRizomUVLinkBase):
             If RizomUV is already running, another instance will be ran
             and the existing one will be left untouched and will be disconnected
             from this object instance.
+
+            If port is None, a free port is assigned by the OS. Should the instance
+            exit during its initialisation (i.e. another program took the port in
+            the meantime), it is ran again on a new port, up to retries times.
+            Collisions are detected only if connect and wait are both enabled.
+
+            The process current directory is left untouched, so several instances
+            can be ran at the same time from different threads (see
+            RunRizomUVInstances). The subprocess.Popen object of the instance is
+            kept in the process attribute and the time spent in launchSeconds.
+
+            Readiness is probed as described by the readiness attribute (see
+            CReadinessPolicy and WaitReady) and the startup phase durations are
+            stored in the startupTimings attribute.
          
             returns:
                 The TCP port number used by the RizomUV instance to communicate.
@@ -50,37 +1133,137 @@ class CRizomUVLink(CRizomUVLinkBase):
         if exePath is None:
             raise CZEx("RizomUV executable path not found. Re-installing RizomUV should fix this issue.")
 
-        # define the TCP port used for communication
-        if port == None:
-            # search a free TCP port on the dynamic range
-            for p in range(49152, 65534):
-                if not self.TCPPortIsOpen(p):
-                    self.port = p
-                    break
-                if p == 65533:
-                    raise CZEx("No available TCP Port found. This shouldn't be the case. Might worth to check your firewall settings just in case.")
-        else:
-            if self.TCPPortIsOpen(port):
-                raise CZEx("Port " + str(port) + " is already in use, please connect using another port")
-            self.port = port
-        
-        # change current directory to the RizomUV executable directory
-        os.chdir(os.path.dirname(exePath))
+        start = time.perf_counter()
+        attempts = retries + 1 if port is None else 1
+        for attempt in range(attempts):
+            self.ReleasePort()
+
+            # define the TCP port used for communication
+            if port is None:
+                self.port = portAllocator.Reserve()
+            else:
+                if self.TCPPortIsOpen(port):
+                    raise CZEx("Port " + str(port) + " is already in use, please connect using another port")
+                portAllocator.ReservePort(port)
+                self.port = port
+            self.reservedPort = self.port
 
-        # run RizomUV asynchronously
-        import subprocess
-        subprocess.Popen(exePath + " -id " + str(self.port))
+            # run RizomUV asynchronously from its executable directory
+            spawnStart = time.perf_counter()
+            try:
+                self.process = subprocess.Popen([exePath, "-id", str(self.port)], cwd = os.path.dirname(exePath))
+            except BaseException:
+                self.ReleasePort()
+                raise
+            self.startupTimings = {"Spawn": time.perf_counter() - spawnStart}
 
-        # connect the the instance
-        if connect:
-            self.Connect(self.port)
+            try:
+                # connect the the instance
+                if connect:
+                    self.Connect(self.port)
         
-        ## wait for RizomUV initialisation to complete
-        if wait:
-            # calling this will force to wait for RizomUV to be ready
-            version = self.RizomUVVersion()
+                ## wait for RizomUV initialisation to complete
+                if wait:
+                    self.WaitReady()
+            except BaseException as ex:
+                # the instance is gone: most likely it could not bind the port
+                if isinstance(ex, CZEx) and self.process.poll() is not None and attempt < attempts - 1:
+                    continue
+                # do not leave a hung instance holding its port and license token
+                self.Terminate()
+                raise
+
+            else:
+                self.launchSeconds = time.perf_counter() - start
+                return self.port
+
+    def WaitReady(self, policy : CReadinessPolicy = None) -> str:
+        """ Waits for the connected RizomUV instance to answer its first request
+
+            The instance TCP port is checked with an increasing delay until it is
+            listening, then the RizomUV version is requested until it answers.
+            Fails as soon as the process ran by RunRizomUV() exits, or when the
+            policy deadline is reached.
+
+            The phase durations, in seconds, are added to the startupTimings attribute:
+            "SocketUp" (until the port is listening), "FirstReply" (until the first
+            answer) and "Total" (including "Spawn" when ran by RunRizomUV()), along with
+            the answering RizomUV "Version" and the number of "ReplyProbes".
+
+            returns:
+                The RizomUV version string
+        """
+        if policy is None:
+            policy = self.readiness
+        start = time.perf_counter()
+        deadline = start + policy.deadlineMs / 1000.0
+
+        delay = policy.pollMs / 1000.0
+        while self.port is not None and not self.TCPPortIsOpen(self.port):
+            self._CheckProcess()
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise CZEx("RizomUV is not listening on port " + str(self.port) + " after " + str(policy.deadlineMs) + " ms")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * policy.backoff, policy.maxPollMs / 1000.0)
+        socketUp = time.perf_counter()
+
+        probes = 0
+        while True:
+            self._CheckProcess()
+            remainingMs = int((deadline - time.perf_counter()) * 1000.0)
+            if remainingMs <= 0:
+                raise CZEx("RizomUV did not answer after " + str(policy.deadlineMs) + " ms")
+            probes += 1
+            try:
+                version = self.Execute("Get", "Vars.Infos.Version.Full", min(policy.replyProbeMs, remainingMs))
+                break
+            except CZEx:
+                if time.perf_counter() >= deadline:
+                    raise
+        firstReply = time.perf_counter()
+
+        self.startupTimings["SocketUp"] = socketUp - start
+        self.startupTimings["FirstReply"] = firstReply - socketUp
+        self.startupTimings["Total"] = firstReply - start + self.startupTimings.get("Spawn", 0.0)
+        self.startupTimings["Version"] = version
+        self.startupTimings["ReplyProbes"] = probes
+        return version
 
-        return self.port
+    def _CheckProcess(self):
+        if self.process is not None and self.process.poll() is not None:
+            raise CZEx("RizomUV exited during its initialisation with code " + str(self.process.returncode))
+
+    def Terminate(self):
+        """ Terminates the RizomUV process ran by RunRizomUV() without any request,
+            i.e. when it does not answer Quit() anymore, and releases its port """
+        try:
+            if self.process is not None and self.process.poll() is None:
+                self.process.terminate()
+                try:
+                    self.process.wait(5)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
+        finally:
+            self.ReleasePort()
+
+    def ReleasePort(self):
+        """ Gives back the port reserved by RunRizomUV(), once: the port attribute is kept """
+        if self.reservedPort is not None:
+            portAllocator.Release(self.reservedPort)
+            self.reservedPort = None
+
+    def Quit(self, params = {}):
+        try:
+            return super().Quit(params)
+        finally:
+            self.ReleasePort()
+
+    def Exit(self, params = {}):
+        try:
+            return super().Exit(params)
+        finally:
+            self.ReleasePort()
         
     def RizomUVPath(self) -> str:
         import platform
@@ -118,4 +1301,33 @@ class CRizomUVLink(CRizomUVLinkBase):
                     pass
 
         return None
-    
\ No newline at end of file
+
+def RunRizomUVInstances(count : int, exePath : str = None) -> tuple:
+    """ Runs count RizomUV instances in parallel and returns once all of them are ready
+
+        returns:
+            (links, totalSeconds): the list of connected CRizomUVLink, each one
+            holding its own startup duration in its launchSeconds attribute, and
+            the wall time spent to get all of them ready.
+
+        If one instance fails to start, the ones already ran are closed and the
+        error is raised (the failing instance is terminated by RunRizomUV). From
+        asyncio code, gather CAsyncRizomUVLink.RunRizomUV() coroutines instead.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    start = time.perf_counter()
+    links = [CRizomUVLink() for i in range(count)]
+    with ThreadPoolExecutor(max_workers = max(count, 1)) as executor:
+        futures = [executor.submit(link.RunRizomUV, exePath) for link in links]
+    errors = [future.exception() for future in futures if future.exception() is not None]
+    if errors:
+        for link, future in zip(links, futures):
+            if future.exception() is None:
+                try:
+                    link.Quit({})
+                except CZEx:
+                    pass
+        raise errors[0]
+
+    return links, time.perf_counter() - start
@@ -0,0 +1,228 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import functools
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from RizomUVLink import CRizomUVLink
+from RizomUVLinkBase import CZEx
+
+class CNotificationSubscriber:
+    """ Change notifications waiting to be consumed by an async iterator
+
+        Holds the latest version of each changed path: when the consumer is slower
+        than the notifications, older versions of a path are replaced instead of
+        queued, so the backlog is bounded by the number of watched paths. Once the
+        pending changes are consumed, an error set by Fail() is raised.
+    """
+    def __init__(self):
+        self.pending = OrderedDict()
+        self.error = None
+        self.event = asyncio.Event()
+
+    def Push(self, path, version):
+        self.pending[path] = version
+        self.pending.move_to_end(path)
+        self.event.set()
+
+    def Fail(self, error : BaseException):
+        self.error = error
+        self.event.set()
+
+    async def Next(self) -> tuple:
+        while not self.pending:
+            if self.error is not None:
+                raise self.error
+            self.event.clear()
+            await self.event.wait()
+        return self.pending.popitem(last = False)
+
+class CNotificationHub:
+    """ Single background thread polling the notification channel of many links
+
+        Links registered by CAsyncRizomUVLink.Notifications() are polled in turn
+        without blocking. Notifications are handed to the event loop of their
+        subscriber. The thread stops when no link is registered anymore.
+    """
+    def __init__(self, poll_ms = 20):
+        self.poll_ms = poll_ms
+        self.lock = threading.Lock()
+        self.subscriptions = {}
+        self.thread = None
+
+    def Register(self, link : CRizomUVLink, loop, subscriber : CNotificationSubscriber):
+        with self.lock:
+            self.subscriptions[id(subscriber)] = (link, loop, subscriber)
+            if self.thread is None:
+                self.thread = threading.Thread(target = self._Loop, name = "RizomUVLink-notifications", daemon = True)
+                self.thread.start()
+
+    def Unregister(self, subscriber : CNotificationSubscriber):
+        with self.lock:
+            self.subscriptions.pop(id(subscriber), None)
+
+    def _Loop(self):
+        while True:
+            with self.lock:
+                subscriptions = list(self.subscriptions.values())
+                if not subscriptions:
+                    self.thread = None
+                    return
+
+            received = False
+            for link, loop, subscriber in subscriptions:
+                for i in range(256):
+                    try:
+                        msg = link.NotifyPoll(0)  # [] or [path, version]
+                    except CZEx as ex:
+                        # the notification channel is gone: the iterator raises the error
+                        self.Unregister(subscriber)
+                        try:
+                            loop.call_soon_threadsafe(subscriber.Fail, ex)
+                        except RuntimeError:
+                            pass
+                        break
+                    if not msg:
+                        break
+                    received = True
+                    path, version = msg[0], msg[1] if len(msg) > 1 else ""
+                    if link.readCache is not None:
+                        link.readCache.Invalidate(path)
+                    try:
+                        loop.call_soon_threadsafe(subscriber.Push, path, version)
+                    except RuntimeError:
+                        # the subscriber event loop is closed
+                        self.Unregister(subscriber)
+                        break
+            if not received:
+                time.sleep(self.poll_ms / 1000.0)
+
+notificationHub = CNotificationHub()
+
+class CAsyncRizomUVLink:
+    """ asyncio front-end of a CRizomUVLink
+
+        Every method of the wrapped link (RunRizomUV, Load, Unfold, Pack, Save, Get...)
+        is exposed as a coroutine with the same name and parameters:
+
+            link = CAsyncRizomUVLink()
+            await link.RunRizomUV()
+            await link.Load({"File.Path": path})
+            await link.Unfold({})
+
+        The blocking call runs on a worker thread owned by this object, so the event
+        loop keeps running while RizomUV works. Each instance has its own worker:
+        commands sent to one link stay ordered, while several links can be driven
+        concurrently with asyncio.gather().
+    """
+    def __init__(self, link : CRizomUVLink = None):
+        self.link = link if link is not None else CRizomUVLink()
+        self.executor = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = "RizomUVLink")
+
+    def __getattr__(self, name):
+        attr = getattr(self.link, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def command(*args, **kwargs):
+            return await self.Call(attr, *args, **kwargs)
+        return command
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, excType, exc, tb):
+        await self.CloseAsync()
+
+    async def Call(self, func, *args, **kwargs):
+        """ Run func(*args, **kwargs) on the link worker thread and await its result """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    async def Execute(self, commandName, parameters):
+        return await self.Call(self.link.Execute, commandName, parameters)
+
+    def StartNotificationListener(self, port, callback, poll_ms = 200, quiet_ms = None, max_latency_ms = 1000):
+        """ Same as CRizomUVLink.StartNotificationListener() but callback(path, version),
+            or callback({path: version}) when coalesced with quiet_ms, is invoked on the
+            calling event loop instead of the listener thread.
+            callback may be a plain function or a coroutine function.
+
+            Returns a stop() function. """
+        loop = asyncio.get_event_loop()
+
+        def dispatch(*args):
+            if asyncio.iscoroutinefunction(callback):
+                asyncio.ensure_future(callback(*args))
+            else:
+                callback(*args)
+
+        def onChange(*args):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(dispatch, *args)
+
+        return self.link.StartNotificationListener(port, onChange, poll_ms, quiet_ms, max_latency_ms)
+
+    async def Notifications(self, paths):
+        """ Asynchronous iterator over the changes of the given data tree paths:
+
+                async for path, version in link.Notifications(["Lib.Mesh.UVW"]):
+                    uvs = await link.Save({"Data": True})
+
+            Subscribes the paths, connects the notification channel and yields a
+            (path, version) pair per change. Leaving the loop (break, exception or
+            task cancellation) unsubscribes. A consumer slower than the changes gets
+            the latest version of each changed path, older versions are dropped.
+            Should the notification channel fail, its CZEx is raised by the loop.
+
+            All the links are polled by one shared thread (see CNotificationHub), so
+            an event loop can follow many instances. As Subscribe replaces the watched
+            set of the instance, use one iterator per link at a time.
+        """
+        port = await self.Subscribe({"Paths": list(paths)})
+        self.link.NotifyConnect(port)
+        subscriber = CNotificationSubscriber()
+        notificationHub.Register(self.link, asyncio.get_event_loop(), subscriber)
+        try:
+            while True:
+                yield await subscriber.Next()
+        finally:
+            notificationHub.Unregister(subscriber)
+            try:
+                await self.Subscribe({})
+            except CZEx:
+                pass
+
+    def Close(self):
+        """ Stop the worker thread once pending commands are done.
+            The RizomUV instance itself is left running, call Quit() before if needed. """
+        self.executor.shutdown(wait = True)
+
+    async def CloseAsync(self):
+        """ Same as Close() but waits for the pending commands without blocking the event loop """
+        await asyncio.get_event_loop().run_in_executor(None, self.executor.shutdown)
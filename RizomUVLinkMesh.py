@@ -0,0 +1,394 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import array
+import json
+import struct
+
+from RizomUVLinkBase import CZEx
+
+# Data.* members holding coordinates, all the others hold indexes
+DOUBLES_MEMBERS = ("CoordsXYZ", "CoordsUVW", "UVWs")
+
+def DefaultTypecode(member : str) -> str:
+    """ Returns the array typecode of a Data.* member: "d" for coordinates, "i" for indexes """
+    return "d" if member.split(".")[-1] in DOUBLES_MEMBERS else "i"
+
+def BufferTypecode(values):
+    """ Returns the item typecode of a buffer protocol object (array.array,
+        numpy array, memoryview...), None if values is not a usable buffer """
+    if isinstance(values, (list, tuple, str, bytes, dict)):
+        return None
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return None
+    typecode = view.format.lstrip("@=<")
+    if len(typecode) != 1 or typecode not in "bBhHiIlLqQfd":
+        return None
+    return typecode
+
+def CompactTypecode(member : str) -> str:
+    """ Returns the compact array typecode of a Data.* member: "f" (float32) for
+        coordinates, "i" (int32) for indexes """
+    return "f" if DefaultTypecode(member) == "d" else "i"
+
+def CompactPrecisionReport(values, compactValues = None) -> dict:
+    """ Measures the error of storing double values as float32
+
+        values are the original doubles (list or buffer). compactValues are their
+        float32 version, computed from values when not given.
+
+        returns:
+            {"Count", "MaxAbsError", "MeanAbsError", "MaxRelError"}
+    """
+    doubles = FlatView(values, "d")
+    if compactValues is None:
+        compactValues = array.array("f", doubles)
+    else:
+        compactValues = FlatView(compactValues, "f")
+
+    maxAbs = 0.0
+    sumAbs = 0.0
+    maxRel = 0.0
+    for value, compact in zip(doubles, compactValues):
+        error = abs(value - compact)
+        sumAbs += error
+        if error > maxAbs:
+            maxAbs = error
+        if value != 0.0 and error / abs(value) > maxRel:
+            maxRel = error / abs(value)
+    count = len(doubles)
+    return {
+        "Count": count,
+        "MaxAbsError": maxAbs,
+        "MeanAbsError": sumAbs / count if count else 0.0,
+        "MaxRelError": maxRel,
+    }
+
+def FlatView(values, typecode : str = None) -> memoryview:
+    """ Returns a one dimension memoryview of values, typed with typecode.
+        Lists are packed into an array first """
+    bufferTypecode = BufferTypecode(values)
+    if bufferTypecode is None:
+        return memoryview(array.array(typecode, values))
+    view = memoryview(values)
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    return view.cast("B").cast(bufferTypecode)
+
+def CopyArray(values, typecode : str) -> array.array:
+    """ Returns an array.array copy of values (list or buffer protocol object), typed
+        with typecode, copying the data once """
+    if BufferTypecode(values) is None:
+        return array.array(typecode, values)
+    view = FlatView(values)
+    copy = array.array(typecode)
+    if view.format == typecode:
+        copy.frombytes(view.cast("B"))
+    else:
+        copy.extend(view)
+    return copy
+
+def MeshKey(parameters : dict):
+    """ Returns a key identifying the mesh a Load would produce, None if the Load
+        parameters do not define a whole mesh (File.Path or Data.PolySizes)
+
+        For files: the absolute path, modification time and size. For data: a hash
+        of the Data.* arrays. Both also cover the other Load options, except the
+        "__" prefixed user interface ones (i.e. "__Focus").
+    """
+    import hashlib
+    import os
+
+    if not isinstance(parameters, dict):
+        return None
+    data = parameters.get("Data")
+    if "File.Path" not in parameters and "Data.PolySizes" not in parameters and not (isinstance(data, dict) and "PolySizes" in data):
+        return None
+
+    digest = hashlib.blake2b(digest_size = 20)
+
+    def update(name, value):
+        digest.update(name.encode("utf-8"))
+        if isinstance(value, dict):
+            for key in sorted(value):
+                update(name + "." + key, value[key])
+        elif isinstance(value, list) and all(isinstance(item, (int, float)) for item in value):
+            typecode = "d" if any(isinstance(item, float) for item in value) else "q"
+            digest.update(typecode.encode("ascii"))
+            digest.update(array.array(typecode, value).tobytes())
+        elif BufferTypecode(value) is not None:
+            view = FlatView(value)
+            digest.update(view.format.encode("ascii"))
+            digest.update(view.cast("B"))
+        else:
+            digest.update(repr(value).encode("utf-8"))
+
+    for key in sorted(parameters):
+        if key.startswith("__"):
+            continue
+        update(key, parameters[key])
+
+    path = parameters.get("File.Path")
+    if path is not None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return ("File", os.path.abspath(path), stat.st_mtime_ns, stat.st_size, digest.hexdigest())
+    return ("Data", digest.hexdigest())
+
+class CUVWState:
+    """ Copy of the UVW coordinates and UVW polygons last sent to (or received from)
+        a RizomUVLink instance, used to compute the vertices that changed since
+
+        version is the "Lib.Mesh.UVW" GetVersion token matching these coordinates.
+    """
+    def __init__(self, coordsUVW, polyUVWIDs):
+        self.coords = CopyArray(coordsUVW, "d")
+        self.polyUVWIDs = CopyArray(polyUVWIDs, "i")
+        self.version = None
+
+    def VertexCount(self) -> int:
+        return len(self.coords) // 3
+
+    def ChangedVertices(self, coordsUVW, tolerance : float = 0.0) -> list:
+        """ Returns the ids of the vertices whose coordinates differ by more than tolerance """
+        coords = FlatView(coordsUVW, "d")
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+
+        if numpy is not None:
+            new = numpy.asarray(coords, dtype = numpy.float64).reshape(-1, 3)
+            old = numpy.frombuffer(self.coords, dtype = numpy.float64).reshape(-1, 3)
+            return numpy.nonzero(numpy.any(numpy.abs(new - old) > tolerance, axis = 1))[0].tolist()
+
+        old = self.coords
+        return [v for v in range(len(old) // 3)
+                if abs(coords[3 * v] - old[3 * v]) > tolerance
+                or abs(coords[3 * v + 1] - old[3 * v + 1]) > tolerance
+                or abs(coords[3 * v + 2] - old[3 * v + 2]) > tolerance]
+
+    def Corners(self, vertexIDs) -> list:
+        """ Returns the polygon vertex (corner) ids referencing the given vertices """
+        wanted = set(vertexIDs)
+        return [corner for corner, vertex in enumerate(self.polyUVWIDs) if vertex in wanted]
+
+    def Update(self, coordsUVW):
+        self.coords = CopyArray(coordsUVW, "d")
+
+    def ApplyPartial(self, polyVertIDs, uvws):
+        """ Applies a Data.CoordsUVWPartial table to the stored coordinates """
+        uvws = FlatView(uvws, "d")
+        for p, corner in enumerate(FlatView(polyVertIDs, "i")):
+            vertex = self.polyUVWIDs[corner]
+            self.coords[3 * vertex:3 * vertex + 3] = array.array("d", uvws[3 * p:3 * p + 3])
+
+class CSharedMesh:
+    """ Mesh arrays stored in a named shared memory segment (Python 3.8 or later)
+
+        A host side handoff helper: lets a process prepare mesh data (i.e. a DCC
+        exporter or a pool job feeder) and hand it to another Python process with
+        only the segment name crossing between them:
+
+            mesh = CSharedMesh.Create({"PolySizes": sizes, "PolyXYZIDs": ids, "CoordsXYZ": xyzs})
+            ...
+            mesh = CSharedMesh.Open(name)
+            link.Load({"Data." + member: values for member, values in mesh.Arrays().items()})
+
+        RizomUV itself cannot read the segment: the Load above still copies the
+        arrays into the command request, like any other Data.* arrays.
+
+        Arrays are given as lists or buffer protocol objects (array.array, numpy...).
+        The segment starts with a JSON table of contents giving, for each array, its
+        typecode, byte offset and item count.
+
+        Keep the creating CSharedMesh open until the other process opened the
+        segment: on Windows a segment is freed as soon as its last handle is
+        closed. On POSIX it persists until Unlink(), which the Python resource
+        tracker also calls when the creating process exits.
+    """
+    def __init__(self, memory, contents : dict, dataOffset : int):
+        self.memory = memory
+        self.name = memory.name
+        self.contents = contents
+        self.dataOffset = dataOffset
+
+    @staticmethod
+    def SharedMemory(*args, **kwargs):
+        try:
+            from multiprocessing import shared_memory
+        except ImportError:
+            raise CZEx("Shared memory mesh transfer needs Python 3.8 or later")
+        return shared_memory.SharedMemory(*args, **kwargs)
+
+    @classmethod
+    def Create(cls, arrays : dict, name : str = None, compact : bool = False):
+        """ Copies the arrays (Data.* member name -> values) into a new segment
+
+            With compact, coordinates are stored as float32 and indexes as int32
+            whatever their input type, halving the size of double / int64 data
+            (see CompactPrecisionReport for the coordinates rounding error) """
+        views = {}
+        contents = {}
+        size = 0
+        for member, values in arrays.items():
+            if compact:
+                typecode = CompactTypecode(member)
+                view = FlatView(values, typecode)
+                if view.format != typecode:
+                    view = memoryview(array.array(typecode, view))
+            else:
+                view = FlatView(values, BufferTypecode(values) or DefaultTypecode(member))
+            size = (size + 7) // 8 * 8
+            contents[member] = [view.format, size, len(view)]
+            views[member] = view
+            size += view.nbytes
+
+        header = json.dumps(contents).encode("utf-8")
+        dataOffset = (8 + len(header) + 7) // 8 * 8
+        memory = cls.SharedMemory(name = name, create = True, size = max(dataOffset + size, 1))
+        memory.buf[0:8] = struct.pack("<Q", len(header))
+        memory.buf[8:8 + len(header)] = header
+        for member, view in views.items():
+            offset = dataOffset + contents[member][1]
+            memory.buf[offset:offset + view.nbytes] = view.cast("B")
+        return cls(memory, contents, dataOffset)
+
+    @classmethod
+    def Open(cls, name : str):
+        """ Maps an existing segment created by Create() """
+        memory = cls.SharedMemory(name = name)
+        headerSize = struct.unpack("<Q", bytes(memory.buf[0:8]))[0]
+        contents = json.loads(bytes(memory.buf[8:8 + headerSize]).decode("utf-8"))
+        return cls(memory, contents, (8 + headerSize + 7) // 8 * 8)
+
+    def Array(self, member : str) -> memoryview:
+        """ Returns a typed memoryview of an array, without copying it """
+        typecode, offset, count = self.contents[member]
+        start = self.dataOffset + offset
+        itemsize = struct.calcsize(typecode)
+        return self.memory.buf[start:start + count * itemsize].cast(typecode)
+
+    def Arrays(self) -> dict:
+        return {member: self.Array(member) for member in self.contents}
+
+    def Close(self):
+        """ Unmaps the segment from this process """
+        self.memory.close()
+
+    def Unlink(self):
+        """ Destroys the segment, once all the processes closed it """
+        self.memory.unlink()
+
+def PrepareLoadParameters(parameters : dict) -> dict:
+    """ Returns Load parameters where the Data.* arrays given as buffer protocol
+        objects (numpy arrays, array.array, memoryview...) are converted to the
+        flat lists expected by the command channel. Multi dimension arrays are
+        flattened, i.e. a numpy (n, 3) coordinates array is accepted as is.
+        Parameters without any buffer are returned unchanged """
+    def convert(value):
+        if isinstance(value, dict):
+            converted = {key: convert(member) for key, member in value.items()}
+            return value if all(converted[key] is value[key] for key in value) else converted
+        if BufferTypecode(value) is not None:
+            return FlatView(value).tolist()
+        return value
+
+    if not isinstance(parameters, dict):
+        return parameters
+    prepared = None
+    for key, value in parameters.items():
+        if key == "Data" or key.startswith("Data.") or key == "DataMesh":
+            converted = convert(value)
+            if converted is not value:
+                if prepared is None:
+                    prepared = dict(parameters)
+                prepared[key] = converted
+    return parameters if prepared is None else prepared
+
+# Save output arrays: (table, member) -> item typecode, "d" standing for the coordinates type
+SAVE_ARRAYS = {
+    ("Data", "CoordsUVW"): "d",
+    ("Data", "PolyUVWIDs"): "i",
+    ("Data", "PolySizes"): "i",
+    ("Data", "SelectedVertIDs"): "i",
+    ("IndexTable", "VertexIDsToIslandIDs"): "i",
+    ("IndexTable", "PolygonIDsToIslandIDs"): "i",
+}
+
+COORDS_TYPECODES = {"float64": "d", "float32": "f"}
+
+def FillBuffer(buffer, values : list) -> memoryview:
+    """ Writes values at the start of a writable buffer protocol object (typed with its
+        own item format) and returns a memoryview of the written part """
+    typecode = BufferTypecode(buffer)
+    if typecode is None:
+        raise CZEx("Save out buffers must be writable buffer protocol objects (numpy array, array.array...)")
+    view = memoryview(buffer)
+    if view.readonly or not view.c_contiguous:
+        raise CZEx("Save out buffers must be writable and contiguous")
+    view = view.cast("B").cast(typecode)
+    if len(view) < len(values):
+        raise CZEx("Save out buffer too small: " + str(len(view)) + " items for " + str(len(values)) + " values")
+    view[0:len(values)] = array.array(typecode, values)
+    return view[0:len(values)]
+
+def ConvertSaveOutput(output : dict, asNumpy : bool = False, out : dict = None, coordsType : str = "float64", asArray : bool = False) -> dict:
+    """ Replaces, in place, the Data.* and IndexTable.* lists of a Save output by typed arrays
+
+        asNumpy:    build numpy arrays, coordinates typed with coordsType ("float64" or
+                    "float32") and indexes as int32
+        asArray:    same with array.array, no numpy needed
+        out:        dict of caller buffers by "<table>.<member>", i.e. {"Data.CoordsUVW": buf},
+                    filled instead of allocating (see FillBuffer)
+
+        Each list is released as soon as its array is built, so only one array is
+        held twice at a time.
+    """
+    if coordsType not in COORDS_TYPECODES:
+        raise CZEx("Unknown coordinates type: " + str(coordsType) + ", use \"float64\" or \"float32\"")
+    numpy = None
+    if asNumpy:
+        try:
+            import numpy
+        except ImportError:
+            raise CZEx("Save asNumpy option needs numpy to be installed")
+    out = out or {}
+
+    for (table, member), typecode in SAVE_ARRAYS.items():
+        values = output.get(table) if isinstance(output, dict) else None
+        if not isinstance(values, dict) or not isinstance(values.get(member), list):
+            continue
+        if typecode == "d":
+            typecode = COORDS_TYPECODES[coordsType]
+        key = table + "." + member
+        if key in out:
+            values[member] = FillBuffer(out[key], values[member])
+        elif numpy is not None:
+            values[member] = numpy.array(values[member], dtype = typecode)
+        elif asArray:
+            values[member] = array.array(typecode, values[member])
+    return output
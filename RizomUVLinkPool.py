@@ -0,0 +1,376 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import queue
+import threading
+import time
+
+from concurrent.futures import Future
+
+from RizomUVLink import CRizomUVLink
+from RizomUVLinkBase import CZEx
+
+def LaunchLink(exePath : str = None) -> CRizomUVLink:
+    """ Runs a new RizomUV instance and returns its connected and initialised link.
+        The time spent is stored in the link coldStartSeconds attribute """
+    start = time.perf_counter()
+    link = CRizomUVLink()
+    link.RunRizomUV(exePath)
+    link.coldStartSeconds = time.perf_counter() - start
+    return link
+
+class CRizomUVPoolWorker:
+    """ One RizomUV instance of a CRizomUVPool and the thread feeding it with jobs """
+    def __init__(self, pool, index : int):
+        self.pool = pool
+        self.index = index
+        self.link = None
+        self.port = None
+        self.busy = False
+        self.jobCount = 0
+        self.failureCount = 0
+        self.launchCount = 0
+        self.launchFailures = 0
+        self.busySeconds = 0.0
+        self.startTime = time.perf_counter()
+        self.thread = threading.Thread(target = self._Loop, name = "RizomUVPool-" + str(index), daemon = True)
+
+    def Start(self):
+        self.thread.start()
+
+    def Link(self) -> CRizomUVLink:
+        """ Returns the connected link, running a new RizomUV instance if needed """
+        if self.link is None:
+            try:
+                self.link = LaunchLink(self.pool.exePath)
+            except Exception:
+                # i.e. OSError from Popen when the exe path is wrong
+                self.launchFailures += 1
+                raise
+            self.port = self.link.port
+            self.launchCount += 1
+        return self.link
+
+    def IsAlive(self) -> bool:
+        try:
+            self.link.RizomUVVersion()
+            return True
+        except CZEx:
+            return False
+
+    def Discard(self):
+        """ Forget the current instance, a new one will be ran for the next job """
+        link = self.link
+        self.link = None
+        try:
+            link.Quit({})
+        except Exception:
+            # most likely hung: do not let it hold its port and license token
+            link.Terminate()
+
+    def Stats(self) -> dict:
+        uptime = time.perf_counter() - self.startTime
+        return {
+            "Index": self.index,
+            "Port": self.port,
+            "Busy": self.busy,
+            "Jobs": self.jobCount,
+            "Failures": self.failureCount,
+            "Launches": self.launchCount,
+            "LaunchFailures": self.launchFailures,
+            "BusySeconds": self.busySeconds,
+            "Uptime": uptime,
+            "Utilization": self.busySeconds / uptime if uptime > 0 else 0.0,
+        }
+
+    def _Loop(self):
+        # launch right away so that all the pool instances initialise in parallel
+        # on failure the launch is retried by the first job, which fails with the error
+        try:
+            self.Link()
+        except Exception:
+            self.link = None
+
+        while True:
+            job = self.pool.jobs.get()
+            if job is None:
+                break
+            future, recipe = job
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            self.busy = True
+            start = time.perf_counter()
+            try:
+                result = self.pool.RunRecipe(self.Link(), recipe)
+            except BaseException as ex:
+                self.failureCount += 1
+                if self.link is not None and not self.IsAlive():
+                    self.Discard()
+                future.set_exception(ex)
+            else:
+                future.set_result(result)
+            finally:
+                self.busySeconds += time.perf_counter() - start
+                self.jobCount += 1
+                self.busy = False
+
+        if self.link is not None and self.pool.quitOnClose:
+            self.Discard()
+
+class CRizomUVPool:
+    """ Runs several RizomUV instances and dispatches jobs to the idle ones
+
+        A job is a recipe: either a list of (commandName, parameters) steps executed
+        in order on the same instance, i.e:
+
+            [("Load", {"File.Path": inPath, "File.XYZUVW": True}),
+             ("Unfold", {}),
+             ("Pack", {"Translate": True}),
+             ("Save", {"File.Path": outPath})]
+
+        or a callable taking the CRizomUVLink of the instance as unique argument.
+
+        Submit() returns a concurrent.futures.Future resolved with the list of the
+        step results (or the callable return value).
+
+        Each RizomUV instance takes 1 token on floating license configuration:
+        licenseTokens caps the number of instances ran by the pool.
+    """
+    def __init__(self, size : int, exePath : str = None, licenseTokens : int = None, quitOnClose : bool = True):
+        if licenseTokens is not None:
+            size = min(size, licenseTokens)
+        if size < 1:
+            raise CZEx("A RizomUV pool needs at least one instance (and one license token)")
+
+        self.exePath = exePath
+        self.quitOnClose = quitOnClose
+        self.jobs = queue.Queue()
+        self.workers = [CRizomUVPoolWorker(self, i) for i in range(size)]
+        for worker in self.workers:
+            worker.Start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        self.Close()
+
+    def Size(self) -> int:
+        return len(self.workers)
+
+    def Submit(self, recipe) -> Future:
+        """ Queue a job, it will run on the first idle instance """
+        future = Future()
+        self.jobs.put((future, recipe))
+        return future
+
+    def Map(self, recipes) -> list:
+        """ Run all the recipes and returns their results in the same order """
+        futures = [self.Submit(recipe) for recipe in recipes]
+        return [future.result() for future in futures]
+
+    def RunRecipe(self, link : CRizomUVLink, recipe):
+        if callable(recipe):
+            return recipe(link)
+        return [link.RunCommand(commandName, parameters) for commandName, parameters in recipe]
+
+    def Utilization(self) -> list:
+        """ Returns one dict of statistics per instance: jobs done, failures,
+            number of launches, busy time and busy ratio since the pool creation """
+        return [worker.Stats() for worker in self.workers]
+
+    def Close(self, wait : bool = True):
+        """ Let the queued jobs finish then stop the workers. The RizomUV instances
+            are closed unless the pool was created with quitOnClose = False """
+        for worker in self.workers:
+            self.jobs.put(None)
+        if wait:
+            for worker in self.workers:
+                worker.thread.join()
+
+class CRizomUVStandby:
+    """ Keeps count RizomUV instances initialised and ready to be acquired
+
+        RunRizomUV() has to wait for the application initialisation before the first
+        command can be sent. A standby set hides that cold start: Acquire() hands
+        over an already initialised link and a new instance is ran in the background
+        to replace it. Release() gives the link back, the scene is reset and the
+        instance is kept in the standby set (or closed if recycle is False or if
+        the set is full).
+
+            standby = CRizomUVStandby(2)
+            link = standby.Acquire()
+            link.Load(...)
+            standby.Release(link)
+
+        licenseTokens caps the number of instances alive at the same time
+        (ready + launching + acquired), each one takes 1 floating license token.
+    """
+    def __init__(self, count : int, exePath : str = None, licenseTokens : int = None):
+        self.count = count
+        self.exePath = exePath
+        self.licenseTokens = licenseTokens
+        self.ready = []
+        self.launching = 0
+        self.inUse = 0
+        self.hits = 0
+        self.misses = 0
+        self.launchFailures = 0
+        self.coldStarts = []
+        self.closed = False
+        self.condition = threading.Condition()
+        with self.condition:
+            self._Fill()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        self.Close()
+
+    def Acquire(self, timeout : float = None) -> CRizomUVLink:
+        """ Returns a ready link. If none is ready a new instance is ran on the calling
+            thread, unless the license token cap is reached: then wait up to timeout
+            seconds (None = forever) for an instance to be ready or released """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        with self.condition:
+            if self.closed:
+                raise CZEx("The RizomUV standby set is closed")
+            if self.ready:
+                self.hits += 1
+                return self._Take()
+
+            self.misses += 1
+            while not self.ready and not self._HasFreeToken():
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    raise CZEx("No RizomUV instance available before timeout, all license tokens are in use")
+                self.condition.wait(remaining)
+            if self.ready:
+                return self._Take()
+            self.inUse += 1
+
+        try:
+            link = LaunchLink(self.exePath)
+        except BaseException:
+            with self.condition:
+                self.inUse -= 1
+                self.launchFailures += 1
+                self.condition.notify_all()
+            raise
+
+        with self.condition:
+            self.coldStarts.append(link.coldStartSeconds)
+        return link
+
+    def Release(self, link : CRizomUVLink, recycle : bool = True):
+        """ Gives back an acquired link """
+        if recycle:
+            try:
+                link.Load({"DefaultEmptyScene": True})
+            except CZEx:
+                recycle = False
+
+        with self.condition:
+            self.inUse -= 1
+            if recycle and not self.closed and len(self.ready) + self.launching < self.count:
+                self.ready.append(link)
+                link = None
+            self._Fill()
+            self.condition.notify_all()
+
+        if link is not None:
+            self._Quit(link)
+
+    def Stats(self) -> dict:
+        """ Returns the hit rate of Acquire() and the cold start durations in seconds """
+        with self.condition:
+            acquired = self.hits + self.misses
+            coldStarts = list(self.coldStarts)
+            return {
+                "Ready": len(self.ready),
+                "Launching": self.launching,
+                "InUse": self.inUse,
+                "Hits": self.hits,
+                "Misses": self.misses,
+                "HitRate": self.hits / acquired if acquired else 0.0,
+                "LaunchFailures": self.launchFailures,
+                "ColdStarts": len(coldStarts),
+                "ColdStartLast": coldStarts[-1] if coldStarts else None,
+                "ColdStartMean": sum(coldStarts) / len(coldStarts) if coldStarts else None,
+                "ColdStartMax": max(coldStarts) if coldStarts else None,
+            }
+
+    def Close(self):
+        """ Closes the ready instances. Acquired links are closed when released """
+        with self.condition:
+            self.closed = True
+            ready, self.ready = self.ready, []
+            self.condition.notify_all()
+        for link in ready:
+            self._Quit(link)
+
+    def _HasFreeToken(self) -> bool:
+        if self.licenseTokens is None:
+            return True
+        return len(self.ready) + self.launching + self.inUse < self.licenseTokens
+
+    def _Take(self) -> CRizomUVLink:
+        link = self.ready.pop()
+        self.inUse += 1
+        self._Fill()
+        return link
+
+    def _Fill(self):
+        # must be called with the condition held
+        while not self.closed and len(self.ready) + self.launching < self.count and self._HasFreeToken():
+            self.launching += 1
+            threading.Thread(target = self._Replenish, daemon = True).start()
+
+    def _Replenish(self):
+        try:
+            link = LaunchLink(self.exePath)
+        except BaseException:
+            with self.condition:
+                self.launching -= 1
+                self.launchFailures += 1
+                self.condition.notify_all()
+            return
+
+        with self.condition:
+            self.launching -= 1
+            self.coldStarts.append(link.coldStartSeconds)
+            if not self.closed:
+                self.ready.append(link)
+                link = None
+            self.condition.notify_all()
+
+        if link is not None:
+            self._Quit(link)
+
+    def _Quit(self, link : CRizomUVLink):
+        try:
+            link.Quit({})
+        except Exception:
+            # most likely hung: do not let it hold its port and license token
+            link.Terminate()
@@ -0,0 +1,119 @@
+# MIT License
+#
+# Copyright (c) [2026] [Rizom-Lab]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Driving several RizomUV instances from one asyncio event loop
+# -------------------------------------------------------------
+#
+# CAsyncRizomUVLink wraps a CRizomUVLink and exposes every command as a
+# coroutine. The blocking call runs on a worker thread owned by the link, so
+# the event loop stays responsive while RizomUV unfolds or packs.
+#
+#   * Commands sent to the same link are executed in order.
+#   * Different links run concurrently: use asyncio.gather() to process several
+#     meshes at once on several RizomUV instances.
+#   * Change notifications can be consumed with an async for loop:
+#         async for path, version in link.Notifications(["Lib.Mesh.UVW"]):
+#             ...
+#     all the links being polled by a single shared thread.
+#
+# WARNING: each RizomUV instance takes 1 token on floating license
+# configuration (see Simple.py).
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import sys
+import os
+import asyncio
+import tempfile
+
+from os.path import dirname
+
+
+def RizomUVWinRegisterInstallPath():
+    """ Returns the path to the most recent version
+        of the RizomUV installation directory on the system using
+        the Windows registry.
+
+        Look for versions from 2029.10 to 2022.2 included
+    """
+    import winreg
+
+    for i in range(9, 1, -1):
+        for j in range(10, -1, -1):
+            if i == 2 and j < 2:
+                continue
+            path = "SOFTWARE\\Rizom Lab\\RizomUV VS RS 202" + str(i) + "." + str(j)
+            try:
+                key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path)
+                exePath = winreg.QueryValue(key, "rizomuv.exe")
+                return os.path.dirname(exePath)
+            except FileNotFoundError:
+                pass
+
+    return None
+
+
+# add the RizomUVLink installation path to the Python module search paths
+sys.path.append(RizomUVWinRegisterInstallPath() + "/RizomUVLink")
+
+# import all RizomUVLink module items
+from RizomUVLink import *
+from RizomUVLinkAsync import *
+
+
+async def process(link, index):
+    """ Load, unfold, pack and save the example mesh on one instance """
+    meshInputPath = dirname(__file__) + "/ExampleMesh.obj"
+    meshOutputPath = tempfile.gettempdir() + "/ExampleMeshOutput" + str(index) + ".obj"
+
+    await link.Load({"File.Path": meshInputPath, "File.XYZUVW": True})
+    await link.Unfold({})
+    await link.Pack({"Translate": True})
+    await link.Save({"File.Path": meshOutputPath})
+    return meshOutputPath
+
+
+async def main():
+    links = [CAsyncRizomUVLink() for i in range(2)]
+
+    # run the instances concurrently and wait for all of them to be ready
+    ports = await asyncio.gather(*[link.RunRizomUV() for link in links])
+    print("RizomUV instances listening on TCP ports: " + str(ports))
+
+    try:
+        # the two meshes are processed at the same time
+        outputs = await asyncio.gather(*[process(link, i) for i, link in enumerate(links)])
+        for path in outputs:
+            print("Saved: " + path)
+    except CZEx as ex:
+        print(str(ex))
+    finally:
+        for link in links:
+            await link.Quit({})
+            await link.CloseAsync()
+
+
+asyncio.run(main())
+
+print("Done")
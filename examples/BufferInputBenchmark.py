@@ -0,0 +1,100 @@
+# MIT License
+#
+# Copyright (c) [2026] [Rizom-Lab]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Buffer input benchmark for Load Data.* parameters
+# -------------------------------------------------
+#
+# Load() accepts numpy arrays, array.array or any buffer protocol object for
+# the Data.* parameters, multi dimension arrays included: a (n, 3) float64
+# coordinates array can be passed as is.
+#
+# This script compares, for a mesh of VERTEX_COUNT vertices, the time spent
+# to prepare the coordinates of a Load call:
+#   * the list path: the caller flattens its array into a Python list
+#   * the buffer path: the array is given as is to Load (PrepareLoadParameters)
+#
+# numpy is used when installed, array.array otherwise.
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import sys
+import os
+import array
+import time
+
+def RizomUVWinRegisterInstallPath():
+    """ Returns the path to the most recent version
+        of the RizomUV installation directory on the system using
+        the Windows registry.
+
+        Look for versions from 2029.10 to 2022.2 included
+    """
+    import winreg
+
+    for i in range(9, 1, -1):
+        for j in range(10, -1, -1):
+            if i == 2 and j < 2:
+                continue
+            path = "SOFTWARE\\Rizom Lab\\RizomUV VS RS 202" + str(i) + "." + str(j)
+            try:
+                key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path)
+                exePath = winreg.QueryValue(key, "rizomuv.exe")
+                return os.path.dirname(exePath)
+            except FileNotFoundError:
+                pass
+
+    return None
+
+
+# add the RizomUVLink installation path to the Python module search paths
+sys.path.append(RizomUVWinRegisterInstallPath() + "/RizomUVLink")
+
+# import all RizomUVLink module items
+from RizomUVLink import *
+
+VERTEX_COUNT = 2000000
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(label + "%.3f" % (time.perf_counter() - start) + " s")
+    return result
+
+
+try:
+    import numpy
+    coords = numpy.random.rand(VERTEX_COUNT, 3)
+    print("numpy (" + str(VERTEX_COUNT) + ", 3) float64 array")
+    timed("  list path   (caller flattens, tolist()): ", lambda: coords.ravel().tolist())
+except ImportError:
+    coords = array.array("d", range(VERTEX_COUNT * 3))
+    print("array.array of " + str(VERTEX_COUNT * 3) + " doubles")
+    timed("  list path   (list(values)):              ", lambda: list(coords))
+
+params = timed("  buffer path (PrepareLoadParameters):     ",
+               lambda: PrepareLoadParameters({"Data.CoordsXYZ": coords}))
+print("  " + str(len(params["Data.CoordsXYZ"])) + " values ready to be sent")
+
+print("Done")
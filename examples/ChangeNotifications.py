@@ -49,8 +49,9 @@
 #     each callback, pull what you actually need with Get()/Save().
 #   * No false positives at rest: a path fires only when its value really changed.
 #   * A long operation (e.g. Pack) may fire several notifications, each carrying
-#     a real intermediate version. Debounce on your side if you want one event
-#     per operation.
+#     a real intermediate version. Pass quiet_ms to StartNotificationListener to
+#     get one callback({path: version}) per burst instead, holding the latest
+#     version of each changed path.
 #   * PUB/SUB can drop the very first messages before the subscription is fully
 #     established: do one full sync right after subscribing, then rely on the
 #     notifications.
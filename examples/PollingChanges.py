@@ -46,6 +46,12 @@
 #   * For a whole subtree (a table whose own counter does not track a
 #     descendant's value change) use the recursive form:
 #         link.GetVersion({"Path": "Lib.Mesh", "Recursive": True})
+#   * GetVersions(paths) reads several tokens at once and returns a
+#     {path: version} dict; items can also be {"Path": ..., "Recursive": True}.
+#
+# StartPoller(paths, callback) runs such a loop on a background thread, with
+# the same callback(path, version) as StartNotificationListener: it polls
+# quickly after a change and backs off exponentially while nothing changes.
 #
 # If you would rather NOT run a polling loop at all, use the push channel:
 # Subscribe({"Paths": [...]}) then StartNotificationListener(port, callback).
@@ -101,8 +107,8 @@ WATCHED_PATHS = [
 
 
 def read_versions(link, paths):
-    """ Return {path: version} for the given paths (one GetVersion call each). """
-    return {p: link.GetVersion(p) for p in paths}
+    """ Return {path: version} for the given paths (one GetVersions batch). """
+    return link.GetVersions(paths)
 
 
 def poll_changes(link, last_versions):
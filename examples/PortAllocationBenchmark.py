@@ -0,0 +1,128 @@
+# MIT License
+#
+# Copyright (c) [2026] [Rizom-Lab]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Free TCP port allocation benchmark
+# ----------------------------------
+#
+# RunRizomUV() needs a free TCP port for each RizomUV instance. Scanning the
+# dynamic range (49152-65535) port by port gets slow when many ports are
+# already taken. CPortAllocator asks the OS for a free port in one step and
+# keeps a process wide registry so that concurrent launches never pick the same
+# port.
+#
+# This script occupies OCCUPIED_PORTS ports at the start of the dynamic range,
+# then compares the time needed to find a free port with the linear scan and
+# with the allocator, then times a full RunRizomUV() launch.
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import sys
+import os
+import socket
+import time
+
+def RizomUVWinRegisterInstallPath():
+    """ Returns the path to the most recent version
+        of the RizomUV installation directory on the system using
+        the Windows registry.
+
+        Look for versions from 2029.10 to 2022.2 included
+    """
+    import winreg
+
+    for i in range(9, 1, -1):
+        for j in range(10, -1, -1):
+            if i == 2 and j < 2:
+                continue
+            path = "SOFTWARE\\Rizom Lab\\RizomUV VS RS 202" + str(i) + "." + str(j)
+            try:
+                key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path)
+                exePath = winreg.QueryValue(key, "rizomuv.exe")
+                return os.path.dirname(exePath)
+            except FileNotFoundError:
+                pass
+
+    return None
+
+
+# add the RizomUVLink installation path to the Python module search paths
+sys.path.append(RizomUVWinRegisterInstallPath() + "/RizomUVLink")
+
+# import all RizomUVLink module items
+from RizomUVLink import *
+
+OCCUPIED_PORTS = 500
+
+
+def occupy_ports(count):
+    """ Listen on count ports of the dynamic range, returns the sockets """
+    sockets = []
+    port = 49152
+    while len(sockets) < count and port < 65535:
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            s.bind(("127.0.0.1", port))
+            s.listen(1)
+            sockets.append(s)
+        except OSError:
+            s.close()
+        port += 1
+    return sockets
+
+
+def linear_scan(link):
+    """ The former RunRizomUV port search """
+    for p in range(49152, 65534):
+        if not link.TCPPortIsOpen(p):
+            return p
+    return None
+
+
+link = CRizomUVLink()
+sockets = occupy_ports(OCCUPIED_PORTS)
+print(str(len(sockets)) + " ports occupied")
+
+try:
+    start = time.perf_counter()
+    port = linear_scan(link)
+    print("Linear scan:    port " + str(port) + " found in " + "%.1f" % ((time.perf_counter() - start) * 1000.0) + " ms")
+
+    start = time.perf_counter()
+    port = portAllocator.Reserve()
+    print("Port allocator: port " + str(port) + " found in " + "%.3f" % ((time.perf_counter() - start) * 1000.0) + " ms")
+    portAllocator.Release(port)
+
+    start = time.perf_counter()
+    port = link.RunRizomUV()
+    print("RunRizomUV:     ready on port " + str(port) + " in " + "%.2f" % (time.perf_counter() - start) + " s")
+    link.Quit({})
+
+except CZEx as ex:
+    print(str(ex))
+
+finally:
+    for s in sockets:
+        s.close()
+
+print("Done")
@@ -114,6 +114,17 @@ print("RizomUV " + link.RizomUVVersion() + " is now listening commands on TCP po
 # in case of nodelocked licenses however, but in case of floating license     
 # you could running out of license token.                                     
 #                                                                             
+# To dispatch many jobs on several instances, CRizomUVPool (module           
+# RizomUVLinkPool) runs and keeps N instances connected, queues the jobs and  
+# caps the number of instances to the available license tokens:              
+#                                                                             
+# from RizomUVLinkPool import CRizomUVPool                                    
+#                                                                             
+# with CRizomUVPool(4, licenseTokens = 2) as pool:                            
+#     futures = [pool.Submit([("Load", {"File.Path": p}), ("Unfold", {}),     
+#                             ("Save", {"File.Path": p})]) for p in paths]    
+#     print(pool.Utilization())                                               
+#                                                                             
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #  
 
 try:
@@ -0,0 +1,131 @@
+# MIT License
+#
+# Copyright (c) [2026] [Rizom-Lab]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Mesh transfer benchmark
+# -----------------------
+#
+# Connect() accepts a port number (loopback TCP) or any complete endpoint
+# string such as "tcp://127.0.0.1:49152".
+#
+# This script connects to each endpoint given on the command line, then
+# loads and saves a generated grid mesh through Data.* parameters and prints
+# the transfer times:
+#
+#   python TransportBenchmark.py tcp://127.0.0.1:49152 tcp://127.0.0.1:49154
+#
+# The RizomUV instances must already listen on those endpoints. Without any
+# argument a new local instance is ran.
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import sys
+import os
+import time
+
+def RizomUVWinRegisterInstallPath():
+    """ Returns the path to the most recent version
+        of the RizomUV installation directory on the system using
+        the Windows registry.
+
+        Look for versions from 2029.10 to 2022.2 included
+    """
+    import winreg
+
+    for i in range(9, 1, -1):
+        for j in range(10, -1, -1):
+            if i == 2 and j < 2:
+                continue
+            path = "SOFTWARE\\Rizom Lab\\RizomUV VS RS 202" + str(i) + "." + str(j)
+            try:
+                key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path)
+                exePath = winreg.QueryValue(key, "rizomuv.exe")
+                return os.path.dirname(exePath)
+            except FileNotFoundError:
+                pass
+
+    return None
+
+
+# add the RizomUVLink installation path to the Python module search paths
+sys.path.append(RizomUVWinRegisterInstallPath() + "/RizomUVLink")
+
+# import all RizomUVLink module items
+from RizomUVLink import *
+
+GRID_SIZE = 1500            # 1500 x 1500 vertices = 2.25M vertices, ~2.2M quads
+
+
+def grid_mesh(n):
+    """ Returns the Load parameters of a n x n vertices flat grid """
+    coords = []
+    for j in range(n):
+        for i in range(n):
+            coords.extend((i / (n - 1), j / (n - 1), 0.0))
+    polys = []
+    for j in range(n - 1):
+        for i in range(n - 1):
+            v = j * n + i
+            polys.extend((v, v + 1, v + n + 1, v + n))
+    return {
+        "Data.PolySizes": [4] * ((n - 1) * (n - 1)),
+        "Data.PolyXYZIDs": polys,
+        "Data.CoordsXYZ": coords,
+        "Data.PolyUVWIDs": polys,
+        "Data.CoordsUVW": coords,
+    }
+
+
+def benchmark(link, params):
+    with link.Timeout(600000):
+        start = time.perf_counter()
+        link.Load(params)
+        loaded = time.perf_counter()
+        link.Save({"Data": True})
+        saved = time.perf_counter()
+    return loaded - start, saved - loaded
+
+
+params = grid_mesh(GRID_SIZE)
+print(str(len(params["Data.CoordsXYZ"]) // 3) + " vertices, " + str(len(params["Data.PolySizes"])) + " polygons")
+
+launched = None
+endpoints = sys.argv[1:]
+if not endpoints:
+    launched = CRizomUVLink()
+    endpoints = ["tcp://127.0.0.1:" + str(launched.RunRizomUV())]
+
+try:
+    for endpoint in endpoints:
+        link = CRizomUVLink()
+        link.Connect(endpoint)
+        loadSeconds, saveSeconds = benchmark(link, params)
+        print(endpoint + ":  Load " + "%.2f" % loadSeconds + " s,  Save " + "%.2f" % saveSeconds + " s")
+
+    if launched is not None:
+        launched.Quit({})
+
+except CZEx as ex:
+    print(str(ex))
+
+print("Done")